@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 import warnings
 import functools
+import weakref
 from collections import OrderedDict
 from collections.abc import Iterable, MutableMapping, MutableSet, MutableSequence
 from enum import Enum
@@ -32,6 +33,28 @@ class DUID:
         DUID.__next_uid += 1
 
 
+# Casting an enumeration scans all of its members, and the same enumerations are cast over and
+# over (every `Const` or comparison made from a member casts its class), so the result is memoized.
+# Enumerations are immutable; the cache stores a plain tuple so that each cast still returns
+# a fresh `Shape`, and holds its keys weakly so that dynamically created enumerations can be freed.
+_enum_shapes = weakref.WeakKeyDictionary()
+
+def _enum_shape(enum_type):
+    try:
+        return _enum_shapes[enum_type]
+    except KeyError:
+        pass
+    min_value = min(member.value for member in enum_type)
+    max_value = max(member.value for member in enum_type)
+    if not isinstance(min_value, int) or not isinstance(max_value, int):
+        raise TypeError("Only enumerations with integer values can be used "
+                        "as value shapes")
+    signed = min_value < 0 or max_value < 0
+    width  = max(bits_for(min_value, signed), bits_for(max_value, signed))
+    _enum_shapes[enum_type] = width, signed
+    return width, signed
+
+
 class Shape:
     """Bit width and signedness of a value.
 
@@ -86,14 +109,7 @@ class Shape:
                          bits_for(obj.stop - obj.step, signed))
             return Shape(width, signed)
         if isinstance(obj, type) and issubclass(obj, Enum):
-            min_value = min(member.value for member in obj)
-            max_value = max(member.value for member in obj)
-            if not isinstance(min_value, int) or not isinstance(max_value, int):
-                raise TypeError("Only enumerations with integer values can be used "
-                                "as value shapes")
-            signed = min_value < 0 or max_value < 0
-            width  = max(bits_for(min_value, signed), bits_for(max_value, signed))
-            return Shape(width, signed)
+            return Shape(*_enum_shape(obj))
         raise TypeError("Object {!r} cannot be used as value shape".format(obj))
 
     def __repr__(self):
@@ -103,19 +119,15 @@ class Shape:
             return "unsigned({})".format(self.width)
 
     def __eq__(self, other):
+        if isinstance(other, Shape):
+            return self.width == other.width and self.signed == other.signed
         if isinstance(other, tuple) and len(other) == 2:
             width, signed = other
             if isinstance(width, int) and isinstance(signed, bool):
                 return self.width == width and self.signed == signed
-            else:
-                raise TypeError("Shapes may be compared with other Shapes and (int, bool) tuples, "
+        raise TypeError("Shapes may be compared with other Shapes and (int, bool) tuples, "
                         "not {!r}"
                         .format(other))
-        if not isinstance(other, Shape):
-            raise TypeError("Shapes may be compared with other Shapes and (int, bool) tuples, "
-                    "not {!r}"
-                    .format(other))
-        return self.width == other.width and self.signed == other.signed
 
 
 def unsigned(width):
@@ -18,6 +18,8 @@ DIR_FANIN  = Direction.FANIN
 
 
 class Layout:
+    __slots__ = ("fields",)
+
     @staticmethod
     def cast(obj, *, src_loc_at=0):
         if isinstance(obj, Layout):
@@ -28,9 +30,8 @@ class Layout:
         self.fields = OrderedDict()
         for field in fields:
             if not isinstance(field, tuple) or len(field) not in (2, 3):
-                raise TypeError("Field {!r} has invalid layout: should be either "
-                                "(name, shape) or (name, shape, direction)"
-                                .format(field))
+                raise TypeError(f"Field {field!r} has invalid layout: should be either "
+                                "(name, shape) or (name, shape, direction)")
             if len(field) == 2:
                 name, shape = field
                 direction = DIR_NONE
@@ -39,32 +40,31 @@ class Layout:
             else:
                 name, shape, direction = field
                 if not isinstance(direction, Direction):
-                    raise TypeError("Field {!r} has invalid direction: should be a Direction "
-                                    "instance like DIR_FANIN"
-                                    .format(field))
+                    raise TypeError(f"Field {field!r} has invalid direction: should be "
+                                    "a Direction instance like DIR_FANIN")
             if not isinstance(name, str):
-                raise TypeError("Field {!r} has invalid name: should be a string"
-                                .format(field))
+                raise TypeError(f"Field {field!r} has invalid name: should be a string")
             if not isinstance(shape, Layout):
                 try:
                     # Check provided shape by calling Shape.cast and checking for exception
                     Shape.cast(shape, src_loc_at=1 + src_loc_at)
                 except Exception:
-                    raise TypeError("Field {!r} has invalid shape: should be castable to Shape "
-                                    "or a list of fields of a nested record"
-                                    .format(field))
+                    raise TypeError(f"Field {field!r} has invalid shape: should be castable "
+                                    "to Shape or a list of fields of a nested record")
             if name in self.fields:
-                raise NameError("Field {!r} has a name that is already present in the layout"
-                                .format(field))
+                raise NameError(f"Field {field!r} has a name that is already present "
+                                "in the layout")
             self.fields[name] = (shape, direction)
 
     def __getitem__(self, item):
         if isinstance(item, tuple):
-            return Layout([
-                (name, shape, dir)
-                for (name, (shape, dir)) in self.fields.items()
-                if name in item
-            ])
+            # The fields of this layout have already been validated, so copy them into
+            # the new layout as they are instead of passing them through the constructor again.
+            layout = Layout([])
+            for name, (shape, dir) in self.fields.items():
+                if name in item:
+                    layout.fields[name] = (shape, dir)
+            return layout
 
         return self.fields[item]
 
@@ -73,16 +73,18 @@ class Layout:
             yield (name, shape, dir)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.fields == other.fields
 
     def __repr__(self):
         field_reprs = []
         for name, shape, dir in self:
             if dir == DIR_NONE:
-                field_reprs.append("({!r}, {!r})".format(name, shape))
+                field_reprs.append(f"({name!r}, {shape!r})")
             else:
-                field_reprs.append("({!r}, {!r}, Direction.{})".format(name, shape, dir.name))
-        return "Layout([{}])".format(", ".join(field_reprs))
+                field_reprs.append(f"({name!r}, {shape!r}, Direction.{dir.name})")
+        return f"Layout([{', '.join(field_reprs)}])"
 
 
 class Record(ValueCastable):
@@ -98,11 +100,10 @@ class Record(ValueCastable):
         def concat(a, b):
             if a is None:
                 return b
-            return "{}__{}".format(a, b)
+            return f"{a}__{b}"
 
         fields = {}
-        for field_name in other.fields:
-            field = other[field_name]
+        for field_name, field in other.fields.items():
             if isinstance(field, Record):
                 fields[field_name] = Record.like(field, name=concat(new_name, field_name),
                                                  src_loc_at=1 + src_loc_at)
@@ -122,10 +123,11 @@ class Record(ValueCastable):
         def concat(a, b):
             if a is None:
                 return b
-            return "{}__{}".format(a, b)
+            return f"{a}__{b}"
 
         self.layout = Layout.cast(layout, src_loc_at=1 + src_loc_at)
         self.fields = OrderedDict()
+        self._width = 0
         for field_name, field_shape, field_dir in self.layout:
             if fields is not None and field_name in fields:
                 field = fields[field_name]
@@ -141,9 +143,14 @@ class Record(ValueCastable):
                 else:
                     self.fields[field_name] = Signal(field_shape, name=concat(name, field_name),
                                                      src_loc_at=1 + src_loc_at)
+            self._width += len(self.fields[field_name])
 
     def __getattr__(self, name):
-        return self[name]
+        try:
+            return self.fields[name]
+        except KeyError:
+            # Let `__getitem__` raise the error with the list of available fields.
+            return self[name]
 
     def __getitem__(self, item):
         if isinstance(item, str):
@@ -153,9 +160,9 @@ class Record(ValueCastable):
                 if self.name is None:
                     reference = "Unnamed record"
                 else:
-                    reference = "Record '{}'".format(self.name)
-                raise AttributeError("{} does not have a field '{}'. Did you mean one of: {}?"
-                                     .format(reference, item, ", ".join(self.fields))) from None
+                    reference = f"Record '{self.name}'"
+                raise AttributeError(f"{reference} does not have a field '{item}'. "
+                                     f"Did you mean one of: {', '.join(self.fields)}?") from None
         elif isinstance(item, tuple):
             return Record(self.layout[item], fields={
                 field_name: field_value
@@ -169,16 +176,16 @@ class Record(ValueCastable):
                 if self.name is None:
                     reference = "Unnamed record"
                 else:
-                    reference = "Record '{}'".format(self.name)
-                raise AttributeError("{} does not have a field '{}'. Did you mean one of: {}?"
-                                     .format(reference, item, ", ".join(self.fields))) from None
+                    reference = f"Record '{self.name}'"
+                raise AttributeError(f"{reference} does not have a field '{item}'. "
+                                     f"Did you mean one of: {', '.join(self.fields)}?") from None
 
     @ValueCastable.lowermethod
     def as_value(self):
         return Cat(self.fields.values())
 
     def __len__(self):
-        return len(self.as_value())
+        return self._width
 
     def _lhs_signals(self):
         return union((f._lhs_signals() for f in self.fields.values()), start=SignalSet())
@@ -196,7 +203,7 @@ class Record(ValueCastable):
         name = self.name
         if name is None:
             name = "<unnamed>"
-        return "(rec {} {})".format(name, " ".join(fields))
+        return f"(rec {name} {' '.join(fields)})"
 
     def shape(self):
         return self.as_value().shape()
@@ -206,16 +213,16 @@ class Record(ValueCastable):
             if record.name is None:
                 return "unnamed record"
             else:
-                return "record '{}'".format(record.name)
+                return f"record '{record.name}'"
 
         for field in include or {}:
             if field not in self.fields:
-                raise AttributeError("Cannot include field '{}' because it is not present in {}"
-                                     .format(field, rec_name(self)))
+                raise AttributeError(f"Cannot include field '{field}' because it is not present "
+                                     f"in {rec_name(self)}")
         for field in exclude or {}:
             if field not in self.fields:
-                raise AttributeError("Cannot exclude field '{}' because it is not present in {}"
-                                     .format(field, rec_name(self)))
+                raise AttributeError(f"Cannot exclude field '{field}' because it is not present "
+                                     f"in {rec_name(self)}")
 
         stmts = []
         for field in self.fields:
@@ -226,17 +233,16 @@ class Record(ValueCastable):
 
             shape, direction = self.layout[field]
             if not isinstance(shape, Layout) and direction == DIR_NONE:
-                raise TypeError("Cannot connect field '{}' of {} because it does not have "
-                                "a direction"
-                                .format(field, rec_name(self)))
+                raise TypeError(f"Cannot connect field '{field}' of {rec_name(self)} because "
+                                "it does not have a direction")
 
             item = self.fields[field]
             subord_items = []
             for subord in subordinates:
                 if field not in subord.fields:
-                    raise AttributeError("Cannot connect field '{}' of {} to subordinate {} "
-                                         "because the subordinate record does not have this field"
-                                         .format(field, rec_name(self), rec_name(subord)))
+                    raise AttributeError(f"Cannot connect field '{field}' of {rec_name(self)} "
+                                         f"to subordinate {rec_name(subord)} because "
+                                         "the subordinate record does not have this field")
                 subord_items.append(subord.fields[field])
 
             if isinstance(shape, Layout):
@@ -267,7 +273,7 @@ for name in [
         "__lshift__", "__rlshift__", "__rshift__", "__rrshift__",
         "__and__", "__rand__", "__xor__", "__rxor__", "__or__", "__ror__",
         "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__",
-        "__abs__", "__len__",
+        "__abs__",
         "as_unsigned", "as_signed", "bool", "any", "all", "xor", "implies",
         "bit_select", "word_select", "matches",
         "shift_left", "shift_right", "rotate_left", "rotate_right", "eq"
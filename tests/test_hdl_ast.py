@@ -1,4 +1,6 @@
+import gc
 import warnings
+import weakref
 from enum import Enum
 
 from amaranth.hdl.ast import *
@@ -134,6 +136,20 @@ class ShapeTestCase(FHDLTestCase):
         self.assertEqual(s2.width, 2)
         self.assertEqual(s2.signed, True)
 
+    def test_cast_enum_twice(self):
+        s1 = Shape.cast(UnsignedEnum)
+        s2 = Shape.cast(UnsignedEnum)
+        self.assertEqual(s1, s2)
+        self.assertIsNot(s1, s2)
+
+    def test_cast_enum_not_retained(self):
+        DynamicEnum = Enum("DynamicEnum", {"FOO": 1, "BAR": 2})
+        self.assertEqual(Shape.cast(DynamicEnum), unsigned(2))
+        ref = weakref.ref(DynamicEnum)
+        del DynamicEnum
+        gc.collect()
+        self.assertIsNone(ref())
+
     def test_cast_enum_bad(self):
         with self.assertRaisesRegex(TypeError,
                 r"^Only enumerations with integer values can be used as value shapes$"):
@@ -65,6 +65,17 @@ class LayoutTestCase(FHDLTestCase):
         ])
         self.assertEqual(layout["a", "c"], expect)
 
+    def test_eq(self):
+        layout = Layout.cast([("a", 1), ("b", [("c", 2)])])
+        self.assertEqual(layout, layout)
+        self.assertEqual(layout, Layout.cast([("a", 1), ("b", [("c", 2)])]))
+        self.assertNotEqual(layout, Layout.cast([("a", 1), ("b", [("c", 3)])]))
+        self.assertNotEqual(layout, Layout.cast([("a", 1), ("d", [("c", 2)])]))
+        layout = Layout([("a", 1)])
+        layout.fields["x"] = (unsigned(4), DIR_NONE)
+        self.assertEqual(layout, Layout([("a", 1), ("x", unsigned(4))]))
+        self.assertNotEqual(layout, Layout([("a", 1)]))
+
     def test_repr(self):
         self.assertEqual(repr(Layout([("a", unsigned(1)), ("b", signed(2))])),
                          "Layout([('a', unsigned(1)), ('b', signed(2))])")
@@ -129,6 +140,33 @@ class RecordTestCase(FHDLTestCase):
         self.assertEqual(repr(r), "(rec <unnamed> stb)")
         self.assertEqual(r.stb.name, "stb")
 
+    def test_len(self):
+        r = Record([
+            ("stb",  1),
+            ("data", signed(8)),
+            ("info", [
+                ("a", range(5)),
+                ("b", UnsignedEnum),
+            ])
+        ])
+        self.assertEqual(len(r), 14)
+        self.assertEqual(len(r), len(r.as_value()))
+
+    def test_len_mutated_layout(self):
+        layout = Layout([("a", 1)])
+        layout.fields["x"] = (unsigned(4), DIR_NONE)
+        r = Record(layout)
+        self.assertEqual(len(r), 5)
+        self.assertEqual(len(r), len(r.as_value()))
+
+    def test_fields_mutated_layout(self):
+        layout = Layout([("a", 1)])
+        layout.fields["x"] = (unsigned(4), DIR_NONE)
+        a, x = Signal(1), Signal(4)
+        r = Record(layout, fields={"a": a, "x": x})
+        self.assertIs(r.a, a)
+        self.assertIs(r.x, x)
+
     def test_iter(self):
         r = Record([
             ("data", 4),